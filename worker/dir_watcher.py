@@ -0,0 +1,57 @@
+import threading
+
+FILE_LIST_DIRECTORY = 0x0001
+CHANGES_BUFFER_BYTES = 8192
+
+
+class DirectoryWatcher:
+    def __init__(self, path, suffix=".json"):
+        self.path = str(path)
+        self.suffix = suffix.lower()
+        self.enabled = False
+        self._changed = threading.Event()
+        self._handle = None
+        self._thread = None
+
+    def start(self):
+        # ReadDirectoryChangesW via pywin32 (installed with pywinauto); without it callers just poll.
+        try:
+            import win32con
+            import win32file
+        except Exception:
+            return False
+        try:
+            self._handle = win32file.CreateFile(
+                self.path,
+                FILE_LIST_DIRECTORY,
+                win32con.FILE_SHARE_READ | win32con.FILE_SHARE_WRITE | win32con.FILE_SHARE_DELETE,
+                None,
+                win32con.OPEN_EXISTING,
+                win32con.FILE_FLAG_BACKUP_SEMANTICS,
+                None,
+            )
+        except Exception:
+            return False
+
+        self._thread = threading.Thread(target=self._run, args=(win32file, win32con), daemon=True)
+        self._thread.start()
+        self.enabled = True
+        return True
+
+    def _run(self, win32file, win32con):
+        flags = win32con.FILE_NOTIFY_CHANGE_FILE_NAME | win32con.FILE_NOTIFY_CHANGE_LAST_WRITE
+        while True:
+            try:
+                changes = win32file.ReadDirectoryChangesW(self._handle, CHANGES_BUFFER_BYTES, False, flags, None, None)
+            except Exception:
+                self.enabled = False
+                self._changed.set()
+                return
+            # An empty result means the change buffer overflowed; wake the caller for a full rescan.
+            if not changes or any(name.lower().endswith(self.suffix) for _, name in changes):
+                self._changed.set()
+
+    def wait(self, timeout):
+        fired = self._changed.wait(timeout)
+        self._changed.clear()
+        return fired
@@ -98,6 +98,9 @@ class Overlay:
         )
 
     def set_text(self, text):
+        # The child already shows _text (initial env or last write), so an identical string needs no pipe write.
+        if text == self._text:
+            return
         self._text = text
         if not self._proc or self._proc.poll() is not None or not self._proc.stdin:
             return
@@ -1,11 +1,18 @@
 ﻿import os
+import queue
+import threading
 import time
 from datetime import datetime
 
+DEFERRED_SNAP_THRESHOLD_SECONDS = 0.5
+SNAP_QUEUE_SIZE = 64
+
 
 class Screenshotter:
-    def __init__(self, output_dir):
+    def __init__(self, output_dir, deferred_threshold=DEFERRED_SNAP_THRESHOLD_SECONDS):
         self.output_dir = output_dir
+        self.deferred_threshold = deferred_threshold
+        self._deferred = {}
         os.makedirs(self.output_dir, exist_ok=True)
         try:
             import mss  # noqa: F401
@@ -13,9 +20,12 @@ class Screenshotter:
         except Exception:
             self._use_mss = False
 
-    def snap(self, name):
+    def _snap_path(self, name):
         ts = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
-        path = os.path.join(self.output_dir, f"{ts}_{name}.png")
+        return os.path.join(self.output_dir, f"{ts}_{name}.png")
+
+    def snap(self, name):
+        path = self._snap_path(name)
         try:
             if self._use_mss:
                 import mss
@@ -29,3 +39,107 @@ class Screenshotter:
             pass
         time.sleep(0.1)
         return path
+
+    def _grab(self):
+        if self._use_mss:
+            import mss
+            with mss.mss() as sct:
+                return sct.grab(sct.monitors[1])
+        from PIL import ImageGrab
+        return ImageGrab.grab()
+
+    def _encode(self, path, frame):
+        if self._use_mss:
+            import mss.tools
+            mss.tools.to_png(frame.rgb, frame.size, output=path)
+        else:
+            frame.save(path)
+
+    def _write_frame(self, name, path, frame):
+        try:
+            self._encode(path, frame)
+        except Exception:
+            pass
+
+    def snap_deferred(self, name):
+        # Grab the pre-step screen now (cheap); it is only encoded and written if the step turns out slow or fails.
+        try:
+            frame = self._grab()
+        except Exception:
+            frame = None
+        self._deferred[name] = (time.monotonic(), self._snap_path(name), frame)
+
+    def commit(self, name, force=False):
+        entry = self._deferred.pop(name, None)
+        if entry is None:
+            return None
+        started, path, frame = entry
+        if frame is None or (not force and time.monotonic() - started < self.deferred_threshold):
+            return None
+        self._write_frame(name, path, frame)
+        return path
+
+    def commit_all(self):
+        for name in list(self._deferred):
+            self.commit(name, force=True)
+
+    def close(self):
+        pass
+
+
+class AsyncScreenshotter(Screenshotter):
+    # The calling thread only grabs the frame; PNG encoding and the disk write happen on a writer thread.
+    def __init__(self, output_dir, queue_size=SNAP_QUEUE_SIZE, **kwargs):
+        super().__init__(output_dir, **kwargs)
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._thread = threading.Thread(target=self._writer, daemon=True)
+        self._thread.start()
+
+    def _write_frame(self, name, path, frame):
+        self._enqueue((name, path, frame))
+
+    def _enqueue(self, item):
+        while True:
+            try:
+                self._queue.put_nowait(item)
+                return
+            except queue.Full:
+                self._evict_one()
+
+    def _evict_one(self):
+        # Under overflow drop a pending frame rather than stall the automation thread:
+        # the oldest periodic shot if there is one, otherwise the oldest shot of any kind.
+        with self._queue.mutex:
+            pending = self._queue.queue
+            if not pending:
+                return
+            victim = next((i for i, item in enumerate(pending) if item and item[0] == "periodic"), 0)
+            del pending[victim]
+        self._queue.task_done()
+
+    def _writer(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                _, path, frame = item
+                self._encode(path, frame)
+            except Exception:
+                pass
+            finally:
+                self._queue.task_done()
+
+    def snap(self, name):
+        path = self._snap_path(name)
+        try:
+            self._enqueue((name, path, self._grab()))
+        except Exception:
+            pass
+        return path
+
+    def close(self):
+        if self._thread.is_alive():
+            # Blocking put: the stop marker waits for room instead of evicting a pending frame.
+            self._queue.put(None)
+            self._thread.join()
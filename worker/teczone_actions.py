@@ -33,6 +33,8 @@ from ui_utils import (
 )
 
 
+INPUT_EXTENSIONS = frozenset({".stp", ".step"})
+
 DEFAULT_WORKFLOW = {
     "enterBendHotkey": "b",
     "useEnterBend": True,
@@ -86,6 +88,20 @@ class TecZoneSession:
         self.material_dialog_title_re = os.getenv("TECZONE_MATERIAL_DIALOG_RE", r".*Material.*")
         self.workflow = self._load_workflow()
 
+    def reset_state(self, logger, screenshotter=None):
+        # Rebind a still-connected session to the next job instead of reconnecting.
+        self.logger = logger
+        self.screenshotter = screenshotter
+        self.workflow = self._load_workflow()
+
+    def is_connected(self):
+        if self.main is None:
+            return False
+        try:
+            return bool(self.main.is_visible())
+        except Exception:
+            return False
+
     def _main_process_id(self):
         try:
             return int(self.main.element_info.process_id)
@@ -303,7 +319,7 @@ class TecZoneSession:
         path = normalize_windows_path(path)
         if not Path(path).exists():
             raise NeedsHelpError(f"Input file not found: {path}")
-        if Path(path).suffix.lower() not in [".stp", ".step"]:
+        if Path(path).suffix.lower() not in INPUT_EXTENSIONS:
             raise NeedsHelpError(f"Unsupported input extension: {path}")
 
         open_start = time.perf_counter()
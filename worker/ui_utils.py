@@ -1,3 +1,4 @@
+import ctypes
 import re
 import time
 
@@ -27,6 +28,12 @@ OVERWRITE_DIALOG_KEYWORDS = [
     "suprascr",
     "replace",
 ]
+DESKTOP_SNAPSHOT_TTL = 0.5
+WINDOW_DUMP_TTL = 1.0
+PASTE_VERIFY_SECONDS = 1.0
+
+_desktop_snapshot = (0.0, None)
+_window_dump = (0.0, None)
 
 
 def normalize_windows_path(value):
@@ -69,24 +76,19 @@ def find_child(parent, control_type=None, title_re=None, auto_id=None, title=Non
         descendants = parent.descendants()
     except Exception:
         descendants = []
+    match_title = bool(title or title_re)
     for ctrl in descendants:
+        # One element_info lookup per node; cheapest checks first so mismatches bail out early.
         try:
-            ctrl_type = ctrl.element_info.control_type
-        except Exception:
-            ctrl_type = None
-        try:
-            ctrl_title = ctrl.window_text() or ""
-        except Exception:
-            ctrl_title = ""
-        try:
-            ctrl_auto_id = ctrl.element_info.automation_id
+            info = ctrl.element_info
+            if control_type and info.control_type != control_type:
+                continue
+            if auto_id and info.automation_id != auto_id:
+                continue
+            ctrl_title = (info.name or "") if match_title else ""
         except Exception:
-            ctrl_auto_id = None
-
-        if control_type and ctrl_type != control_type:
-            continue
-        if auto_id and ctrl_auto_id != auto_id:
             continue
+
         if title and ctrl_title != title:
             continue
         if title_re and not re.search(title_re, ctrl_title):
@@ -125,6 +127,24 @@ def _window_pid(win):
         return None
 
 
+def _snapshot_desktop_windows(ttl=DESKTOP_SNAPSHOT_TTL):
+    # Top-level enumeration can hang for a long time; share one scan between callers in the same tick.
+    global _desktop_snapshot
+    now = time.monotonic()
+    taken_at, windows = _desktop_snapshot
+    if windows is not None and now - taken_at < ttl:
+        return windows
+    windows = []
+    for w in Desktop(backend="uia").windows():
+        try:
+            title = (w.window_text() or "").strip()
+        except Exception:
+            title = ""
+        windows.append((w, title, _window_pid(w)))
+    _desktop_snapshot = (now, windows)
+    return windows
+
+
 def _open_search_roots(parent=None, process_id=None, include_descendants=False):
     roots = []
     if parent is not None:
@@ -202,6 +222,40 @@ def _is_common_file_dialog(dlg):
     return has_file_name and has_primary and has_cancel
 
 
+def _foreground_window(skip_handle=None):
+    try:
+        hwnd = ctypes.windll.user32.GetForegroundWindow()
+    except Exception:
+        return None
+    if not hwnd or hwnd == skip_handle:
+        return None
+    try:
+        return Desktop(backend="uia").window(handle=hwnd).wrapper_object()
+    except Exception:
+        return None
+
+
+def _foreground_open_dialog(title_re=OPEN_TITLE_RE, process_id=None, skip_handle=None):
+    # A freshly opened file dialog is almost always the foreground window; probe it before enumerating.
+    # skip_handle is the parent window, which find_open_dialog already scans.
+    dlg = _foreground_window(skip_handle)
+    if dlg is None:
+        return None
+    if process_id is not None and _window_pid(dlg) != int(process_id):
+        return None
+    if not _is_common_file_dialog(dlg):
+        return None
+    try:
+        title = (dlg.window_text() or "").strip()
+    except Exception:
+        title = ""
+    if title and re.search(title_re, title):
+        return dlg
+    if find_child(dlg, control_type="Button", title_re=OPEN_TITLE_RE):
+        return dlg
+    return None
+
+
 def find_open_dialog(parent=None, title_re=OPEN_TITLE_RE, process_id=None):
     roots = _open_search_roots(parent, process_id=process_id, include_descendants=False)
     for dlg in roots:
@@ -335,10 +389,12 @@ def set_file_name(dialog, value):
         return edits[0] if edits else None
 
     last_error = None
+    resolved = []
     for candidate in deduped:
         edit_ctrl = resolve_edit(candidate)
         if not edit_ctrl:
             continue
+        resolved.append(edit_ctrl)
         try:
             edit_ctrl.set_focus()
             edit_ctrl.set_edit_text(value)
@@ -347,9 +403,67 @@ def set_file_name(dialog, value):
             last_error = e
             continue
 
+    # Fallback when set_edit_text is rejected: one clipboard paste instead of typing every character.
+    # paste_text only returns once the edit actually holds value.
+    for edit_ctrl in resolved:
+        try:
+            edit_ctrl.set_focus()
+            paste_text(value, edit_ctrl)
+            return edit_ctrl
+        except Exception as e:
+            last_error = e
+            continue
+
     raise RuntimeError(f"File name edit not found/settable (strict mode): {last_error}")
 
 
+def _edit_value(ctrl):
+    # UIA edits expose their content through the Value pattern; window_text() is the fallback.
+    try:
+        return ctrl.get_value()
+    except Exception:
+        return ctrl.window_text()
+
+
+def paste_text(value, ctrl, timeout=PASTE_VERIFY_SECONDS):
+    # Raises instead of pasting when the clipboard holds non-text data (it could not be put back),
+    # and when the value never shows up in ctrl; callers then fall back or fail the step.
+    import win32clipboard
+
+    win32clipboard.OpenClipboard()
+    try:
+        has_text = win32clipboard.IsClipboardFormatAvailable(win32clipboard.CF_UNICODETEXT)
+        if win32clipboard.CountClipboardFormats() and not has_text:
+            raise RuntimeError("Clipboard holds non-text data; not pasting over it")
+        # Only the plain-text form is restored; richer formats stored next to it are lost.
+        previous = win32clipboard.GetClipboardData(win32clipboard.CF_UNICODETEXT) if has_text else None
+        win32clipboard.EmptyClipboard()
+        win32clipboard.SetClipboardText(value, win32clipboard.CF_UNICODETEXT)
+    finally:
+        win32clipboard.CloseClipboard()
+
+    try:
+        ctrl.type_keys("^a{BACKSPACE}^v", set_foreground=True)
+        # Keep our text on the clipboard until the control shows it: restoring earlier would let a
+        # late Ctrl+V paste the operator's old clipboard instead.
+        deadline = time.monotonic() + timeout
+        while _edit_value(ctrl) != value:
+            if time.monotonic() >= deadline:
+                raise RuntimeError(f"Pasted text did not show up in the edit control: {value}")
+            time.sleep(0.05)
+    finally:
+        try:
+            win32clipboard.OpenClipboard()
+            try:
+                win32clipboard.EmptyClipboard()
+                if previous is not None:
+                    win32clipboard.SetClipboardText(previous, win32clipboard.CF_UNICODETEXT)
+            finally:
+                win32clipboard.CloseClipboard()
+        except Exception:
+            pass
+
+
 def ensure_dialog_focus(dialog, timeout=2.0):
     deadline = time.time() + timeout
     while time.time() < deadline:
@@ -449,9 +563,15 @@ def wait_window_closed(window, timeout=90):
 
 
 def wait_for_open_dialog(timeout=5, parent=None, process_id=None, poll_interval=0.08):
+    try:
+        parent_handle = parent.handle if parent is not None else None
+    except Exception:
+        parent_handle = None
     deadline = time.time() + timeout
     while time.time() < deadline:
-        dlg = find_open_dialog(parent=parent, process_id=process_id)
+        dlg = _foreground_open_dialog(process_id=process_id, skip_handle=parent_handle)
+        if dlg is None:
+            dlg = find_open_dialog(parent=parent, process_id=process_id)
         if dlg:
             return dlg
         time.sleep(poll_interval)
@@ -519,15 +639,9 @@ def click_menu_item_anywhere(label, timeout=4, process_id=None):
 
 
 def find_unexpected_dialog(process_id=None, ignore_overwrite=False):
-    desktop = Desktop(backend="uia")
-    for dlg in desktop.windows():
-        try:
-            if process_id is not None and int(dlg.element_info.process_id) != int(process_id):
-                continue
-        except Exception:
-            if process_id is not None:
-                continue
-        title = (dlg.window_text() or "").strip()
+    for dlg, title, pid in _snapshot_desktop_windows():
+        if process_id is not None and (pid is None or pid != int(process_id)):
+            continue
         if not title:
             continue
 
@@ -558,9 +672,7 @@ def find_unexpected_dialog(process_id=None, ignore_overwrite=False):
 
 
 def handle_possible_dialogs():
-    desktop = Desktop(backend="uia")
-    for dlg in desktop.windows():
-        title = dlg.window_text()
+    for dlg, title, _ in _snapshot_desktop_windows():
         if not title:
             continue
         if "warning" in title.lower() or "confirm" in title.lower() or "overwrite" in title.lower():
@@ -584,3 +696,37 @@ def dump_window_titles():
         if t:
             titles.append(t)
     return titles
+
+
+def dump_windows(ttl=WINDOW_DUMP_TTL):
+    # Active title and all titles from one enumeration (matched by HWND) instead of two UIA round-trips.
+    # NEEDS_HELP retries within the TTL reuse the same dump.
+    global _window_dump
+    now = time.monotonic()
+    taken_at, dump = _window_dump
+    if dump is not None and now - taken_at < ttl:
+        return dump
+    try:
+        foreground = ctypes.windll.user32.GetForegroundWindow()
+    except Exception:
+        foreground = None
+    active = ""
+    titles = []
+    for w in Desktop(backend="uia").windows():
+        try:
+            t = w.window_text()
+        except Exception:
+            t = ""
+        if not t:
+            continue
+        titles.append(t)
+        if foreground and not active:
+            try:
+                if w.handle == foreground:
+                    active = t
+            except Exception:
+                pass
+    if foreground is None:
+        active = get_active_window_title()
+    _window_dump = (now, (active, titles))
+    return active, titles
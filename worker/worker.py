@@ -1,29 +1,81 @@
 import argparse
+import atexit
+import functools
+import io
 import json
 import logging
 import os
+import queue
 import threading
 import time
-import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+from dir_watcher import DirectoryWatcher
 from overlay import Overlay
-from screenshot import Screenshotter
-from teczone_actions import NeedsHelpError, TecZoneSession
-from ui_utils import dump_window_titles, get_active_window_title
+from screenshot import AsyncScreenshotter
+from teczone_actions import INPUT_EXTENSIONS, NeedsHelpError, TecZoneSession
+from ui_utils import dump_windows
 from xometry_parser import load_xometry_map
 
 DEFAULT_POLL_SECONDS = 2
+WATCHED_RESCAN_SECONDS = 30
+LOG_BUFFER_BYTES = 8192
 MAJOR_STEPS = ["OPEN_FILE", "SET_MATERIAL", "EXPORT_GEO"]
+MAJOR_STEPS_LEN = len(MAJOR_STEPS)
+STEP_INDEX = {name: i + 1 for i, name in enumerate(MAJOR_STEPS)}
+POST_PROCESS_WORKERS = 2
+HOTKEY_DEBOUNCE_NS = 300_000_000
+SOUND_DRAIN_SECONDS = 2.0
+REPLACE_RETRIES = 5
+REPLACE_RETRY_SECONDS = 0.05
+HOTKEY_TOKEN_MAP = {
+    "ctrl": "<ctrl>",
+    "control": "<ctrl>",
+    "alt": "<alt>",
+    "shift": "<shift>",
+    "win": "<cmd>",
+    "windows": "<cmd>",
+    "cmd": "<cmd>",
+}
+FINISHED_MARKER_SUFFIXES = (".done", ".failed", ".partial", ".needs_help")
 
 try:
     import sentry_sdk
 except Exception:
     sentry_sdk = None
 
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+TELEMETRY_QUEUE_MAX = 1000
+TELEMETRY_BATCH_MAX = 20
+TELEMETRY_BATCH_SECONDS = 5
+TELEMETRY_FLUSH_SECONDS = 2.0
+
 _TELEMETRY_INIT_DONE = False
 _TELEMETRY_ENABLED = False
+LOG_FORMATTER = logging.Formatter("%(asctime)s | %(levelname)s | %(message)s")
+
+_telemetry_queue = queue.Queue(maxsize=TELEMETRY_QUEUE_MAX)
+_telemetry_critical_queue = queue.Queue()
+_telemetry_wakeup = threading.Event()
+_telemetry_thread = None
+_claimed_local = set()
+_sound_queue = queue.Queue()
+_sound_thread = None
+_sound_lock = threading.Lock()
+_claimed_lock = threading.Lock()
+_write_queue = queue.Queue()
+_write_thread = None
+_write_lock = threading.Lock()
+_write_errors = {}
+_ENSURED_DIRS = set()
+_teczone_session = None
+_overlay = None
 
 
 def resolve_glitchtip_dsn():
@@ -51,6 +103,7 @@ def init_glitchtip(logger=None):
 
     try:
         sentry_sdk.init(dsn=dsn, traces_sample_rate=0.0)
+        _start_telemetry_worker()
         _TELEMETRY_ENABLED = True
         if logger:
             logger.info("GlitchTip enabled")
@@ -62,6 +115,94 @@ def init_glitchtip(logger=None):
         return False
 
 
+def _start_telemetry_worker():
+    global _telemetry_thread
+    if _telemetry_thread is not None:
+        return
+    _telemetry_thread = threading.Thread(target=_telemetry_worker, name="glitchtip", daemon=True)
+    _telemetry_thread.start()
+    atexit.register(flush_glitchtip)
+
+
+def _drain_queue(q, limit=None):
+    items = []
+    while limit is None or len(items) < limit:
+        try:
+            items.append(q.get_nowait())
+        except queue.Empty:
+            break
+    return items
+
+
+def _send_glitchtip_batch(batch):
+    for payload in batch:
+        try:
+            _send_glitchtip_event(payload)
+        except Exception:
+            pass
+    try:
+        sentry_sdk.flush(TELEMETRY_FLUSH_SECONDS)
+    except Exception:
+        pass
+
+
+def _telemetry_worker():
+    # Two tiers: error events (and flush requests) go out immediately, info events are
+    # batched up to TELEMETRY_BATCH_MAX or TELEMETRY_BATCH_SECONDS.
+    batch = []
+    batch_deadline = None
+    while True:
+        timeout = None if batch_deadline is None else max(0.0, batch_deadline - time.monotonic())
+        _telemetry_wakeup.wait(timeout)
+        _telemetry_wakeup.clear()
+
+        critical = _drain_queue(_telemetry_critical_queue)
+        flush_waiters = [item for item in critical if isinstance(item, threading.Event)]
+        critical = [item for item in critical if not isinstance(item, threading.Event)]
+        if critical:
+            _send_glitchtip_batch(critical)
+
+        if flush_waiters:
+            batch.extend(_drain_queue(_telemetry_queue))
+        else:
+            batch.extend(_drain_queue(_telemetry_queue, TELEMETRY_BATCH_MAX - len(batch)))
+        if batch and batch_deadline is None:
+            batch_deadline = time.monotonic() + TELEMETRY_BATCH_SECONDS
+        if batch and (flush_waiters or len(batch) >= TELEMETRY_BATCH_MAX or time.monotonic() >= batch_deadline):
+            _send_glitchtip_batch(batch)
+            batch = []
+            batch_deadline = None
+            if not _telemetry_queue.empty():
+                _telemetry_wakeup.set()
+
+        for waiter in flush_waiters:
+            waiter.set()
+
+
+def flush_glitchtip(timeout=TELEMETRY_BATCH_SECONDS):
+    if _telemetry_thread is None or not _telemetry_thread.is_alive():
+        return False
+    done = threading.Event()
+    _telemetry_critical_queue.put(done)
+    _telemetry_wakeup.set()
+    return done.wait(timeout)
+
+
+def _send_glitchtip_event(payload):
+    with sentry_sdk.new_scope() as scope:
+        for key, value in payload["tags"]:
+            if value is not None and value != "":
+                scope.set_tag(key, str(value))
+        for key, value in payload["extras"]:
+            if value is not None and value != "":
+                scope.set_extra(key, str(value))
+
+        if payload["exc"] is not None:
+            sentry_sdk.capture_exception(payload["exc"])
+        else:
+            sentry_sdk.capture_message(payload["message"], level=payload["level"])
+
+
 def capture_glitchtip_event(
     level,
     message,
@@ -82,46 +223,55 @@ def capture_glitchtip_event(
     if not _TELEMETRY_ENABLED or sentry_sdk is None:
         return
 
-    with sentry_sdk.new_scope() as scope:
-        scope.set_tag("app", "teczonebend-worker")
-        if job_id:
-            scope.set_tag("jobId", str(job_id))
-        if xometry_ref:
-            scope.set_tag("xometryRef", str(xometry_ref))
-        if status:
-            scope.set_tag("status", str(status))
-        if step:
-            scope.set_tag("step", str(step))
-        if part_id is not None:
-            scope.set_tag("partId", str(part_id))
-
-        if project_root:
-            scope.set_extra("projectRoot", str(project_root))
-        if input_path:
-            scope.set_extra("inputPath", str(input_path))
-        if export_path:
-            scope.set_extra("exportPath", str(export_path))
-        if log_path:
-            scope.set_extra("logPath", str(log_path))
-        if screenshots_dir:
-            scope.set_extra("screenshotsDir", str(screenshots_dir))
-        if reason:
-            scope.set_extra("reason", str(reason))
-
-        if exc is not None:
-            sentry_sdk.capture_exception(exc)
-        else:
-            sentry_sdk.capture_message(message, level=level)
+    payload = {
+        "level": level,
+        "message": message,
+        "exc": exc,
+        "tags": (
+            ("app", "teczonebend-worker"),
+            ("jobId", job_id),
+            ("xometryRef", xometry_ref),
+            ("status", status),
+            ("step", step),
+            ("partId", part_id),
+        ),
+        "extras": (
+            ("projectRoot", project_root),
+            ("inputPath", input_path),
+            ("exportPath", export_path),
+            ("logPath", log_path),
+            ("screenshotsDir", screenshots_dir),
+            ("reason", reason),
+        ),
+    }
+    if level == "error":
+        _telemetry_critical_queue.put(payload)
+    else:
+        try:
+            _telemetry_queue.put_nowait(payload)
+        except queue.Full:
+            logging.getLogger("worker").debug("GlitchTip queue full; dropped event: %s", message)
+            return
+    _telemetry_wakeup.set()
 
 
 class PauseController:
     def __init__(self, logger):
         self.logger = logger
-        self._paused = False
         self._lock = threading.Lock()
+        # Set while running, cleared while paused; the event is the only pause state.
+        self._resume_event = threading.Event()
+        self._resume_event.set()
+        self._last_toggle_ns = 0
+        self._toggle_q = queue.Queue()
         self._listener = None
+        self._stopped = False
 
     def start(self, hotkey_spec):
+        # Importing pynput and hooking the keyboard is slow; the job carries on while it happens.
+        threading.Thread(target=self._start_listener, args=(hotkey_spec,), name="hotkeys", daemon=True).start()
+
+    def _start_listener(self, hotkey_spec):
         try:
             from pynput import keyboard
         except Exception as e:
@@ -133,52 +283,98 @@ class PauseController:
             return
 
         def on_toggle():
+            # Runs on the pynput hook thread: record the press and return immediately.
+            self._toggle_q.put(time.monotonic_ns())
+
+        # This runs on a background thread, so an error here must be logged rather than raised.
+        try:
+            normalized = normalize_hotkey(hotkey_spec)
+            listener = keyboard.GlobalHotKeys({normalized: on_toggle})
+            listener.daemon = True
             with self._lock:
-                self._paused = not self._paused
-                state = "PAUSED by hotkey" if self._paused else "RESUMED by hotkey"
-                self.logger.info(state)
-
-        normalized = normalize_hotkey(hotkey_spec)
-        self._listener = keyboard.GlobalHotKeys({normalized: on_toggle})
-        self._listener.daemon = True
-        self._listener.start()
+                if self._stopped:
+                    return
+                listener.start()
+                self._listener = listener
+        except Exception as e:
+            self.logger.warning("Hotkeys disabled: %s", e)
+            return
+        threading.Thread(target=self._toggle_worker, name="hotkey-toggle", daemon=True).start()
         self.logger.info("Pause hotkey enabled: %s", hotkey_spec)
 
+    def _toggle_worker(self):
+        while True:
+            pressed_ns = self._toggle_q.get()
+            if pressed_ns is None:
+                return
+            with self._lock:
+                # Key autorepeat can fire the hotkey twice in a row; only the first press counts.
+                if pressed_ns - self._last_toggle_ns < HOTKEY_DEBOUNCE_NS:
+                    continue
+                self._last_toggle_ns = pressed_ns
+                if self._resume_event.is_set():
+                    self._resume_event.clear()
+                    state = "PAUSED by hotkey"
+                else:
+                    self._resume_event.set()
+                    state = "RESUMED by hotkey"
+            self.logger.info(state)
+
     def is_paused(self):
-        with self._lock:
-            return self._paused
+        return not self._resume_event.is_set()
+
+    def wait_resume(self, timeout=None):
+        return self._resume_event.wait(timeout)
 
     def stop(self):
-        if self._listener:
-            self._listener.stop()
+        with self._lock:
+            self._stopped = True
+            listener = self._listener
+        if listener:
+            listener.stop()
+        self._toggle_q.put(None)
 
 
+@functools.lru_cache(maxsize=32)
 def normalize_hotkey(value):
-    tokens = [x.strip().lower() for x in value.split("+") if x.strip()]
-    mapped = []
-    for token in tokens:
-        if token in ["ctrl", "control"]:
-            mapped.append("<ctrl>")
-        elif token == "alt":
-            mapped.append("<alt>")
-        elif token == "shift":
-            mapped.append("<shift>")
-        elif token in ["win", "windows", "cmd"]:
-            mapped.append("<cmd>")
-        else:
-            mapped.append(token)
-    return "+".join(mapped)
+    tokens = (x.strip().lower() for x in value.split("+"))
+    return "+".join(HOTKEY_TOKEN_MAP.get(t, t) for t in tokens if t)
+
+
+def _sound_worker():
+    while True:
+        item = _sound_queue.get()
+        if isinstance(item, threading.Event):
+            # Drain marker from wait_for_sounds; everything queued before it has played.
+            item.set()
+            continue
+        pattern, logger = item
+        try:
+            import winsound
+
+            # Beep blocks for each tone, so notes already play back to back.
+            for freq, duration_ms in pattern:
+                winsound.Beep(freq, duration_ms)
+        except Exception as e:
+            logger.debug("Sound playback skipped: %s", e)
 
 
 def play_sound_pattern(pattern, logger):
-    try:
-        import winsound
+    global _sound_thread
+    with _sound_lock:
+        if _sound_thread is None:
+            _sound_thread = threading.Thread(target=_sound_worker, name="sounds", daemon=True)
+            _sound_thread.start()
+    _sound_queue.put((pattern, logger))
 
-        for freq, duration_ms in pattern:
-            winsound.Beep(freq, duration_ms)
-            time.sleep(0.03)
-    except Exception as e:
-        logger.debug("Sound playback skipped: %s", e)
+
+def wait_for_sounds(timeout=SOUND_DRAIN_SECONDS):
+    # Bounded so a wedged audio device cannot keep the process from exiting.
+    if _sound_thread is None:
+        return True
+    drained = threading.Event()
+    _sound_queue.put(drained)
+    return drained.wait(timeout)
 
 
 def play_job_start_sound(logger):
@@ -197,59 +393,300 @@ def play_job_end_sound(logger, status):
 
 
 def read_json(path):
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
     with open(path, "r", encoding="utf-8") as f:
         return json.load(f)
 
 
-def write_json(path, data):
-    Path(path).parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+def dump_json_bytes(data):
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _ensure_dir(path):
+    # mkdir(exist_ok=True) still costs a CreateDirectoryW per call; do it once per directory per process.
+    key = str(path)
+    if key in _ENSURED_DIRS:
+        return
+    Path(key).mkdir(parents=True, exist_ok=True)
+    _ENSURED_DIRS.add(key)
+
+
+def _in_ensured_dir(path, action):
+    # The cache goes stale if someone deletes the directory under a running worker:
+    # forget it, recreate it and retry once.
+    try:
+        return action()
+    except FileNotFoundError:
+        _ENSURED_DIRS.discard(str(path))
+        _ensure_dir(path)
+        return action()
+
+
+def write_bytes_atomic(path, payload):
+    # Write to a sibling temp file and rename over the target so readers never see a partial file.
+    target = Path(path)
+    _ensure_dir(target.parent)
+    tmp = target.with_suffix(target.suffix + ".tmp")
+    _in_ensured_dir(target.parent, lambda: tmp.write_bytes(payload))
+    _replace_with_retry(tmp, target)
+
+
+def _replace_with_retry(src, dst):
+    # On Windows os.replace fails with PermissionError while a reader holds dst open without delete sharing.
+    for attempt in range(REPLACE_RETRIES):
+        try:
+            os.replace(src, dst)
+            return
+        except PermissionError:
+            if attempt == REPLACE_RETRIES - 1:
+                raise
+            time.sleep(REPLACE_RETRY_SECONDS)
+
+
+class BufferedLogHandler(logging.StreamHandler):
+    # Appends to the job log through an 8 KiB buffer; callers flush explicitly
+    # where durability matters (NEEDS_HELP, end of job). logging.shutdown flushes at exit.
+    def __init__(self, log_path):
+        raw = io.FileIO(log_path, "ab")
+        stream = io.TextIOWrapper(io.BufferedWriter(raw, buffer_size=LOG_BUFFER_BYTES), encoding="utf-8")
+        super().__init__(stream)
+
+    def emit(self, record):
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+    def close(self):
+        self.acquire()
+        try:
+            try:
+                self.stream.flush()
+                self.stream.close()
+            except Exception:
+                pass
+            super().close()
+        finally:
+            self.release()
+
+
+def _publish_result(result_path, payload):
+    try:
+        write_bytes_atomic(result_path, payload)
+    except Exception:
+        # The job will be marked FAILED; do not leave an older <jobId>.result.json behind that disagrees.
+        for leftover in (result_path, result_path.with_suffix(result_path.suffix + ".tmp")):
+            try:
+                leftover.unlink()
+            except OSError:
+                pass
+        raise
+
+    # The shared WORK\logs\result.json is a hard link to the per-job file, swapped in atomically.
+    # It is only a convenience alias: failing to refresh it never changes the job status.
+    latest_path = result_path.parent / "result.json"
+    staging_path = result_path.parent / "result.json.new"
+    try:
+        try:
+            if staging_path.exists():
+                staging_path.unlink()
+            os.link(result_path, staging_path)
+            _replace_with_retry(staging_path, latest_path)
+        except OSError:
+            write_bytes_atomic(latest_path, payload)
+    except OSError as e:
+        for leftover in (staging_path, latest_path.with_suffix(latest_path.suffix + ".tmp")):
+            try:
+                leftover.unlink()
+            except OSError:
+                pass
+        logging.getLogger("worker").warning("Could not refresh %s: %s", latest_path, e)
+        capture_glitchtip_event(
+            "warning",
+            "worker could not refresh result.json",
+            job_id=result_path.name[: -len(".result.json")],
+            step="WRITE_RESULT",
+            reason=f"{latest_path}: {e}",
+        )
+
+
+def _result_writer():
+    while True:
+        result_path, payload = _write_queue.get()
+        try:
+            _publish_result(result_path, payload)
+        except Exception as e:
+            # The job's log handler may already be closed; wait_for_writes hands the error to the caller.
+            _write_errors[str(result_path)] = e
+        finally:
+            _write_queue.task_done()
+
+
+def write_result(log_dir, job_id, result):
+    # Serialize on the caller so later mutations of result cannot leak in; the disk I/O runs on the writer thread.
+    global _write_thread
+    result_path = Path(log_dir) / f"{job_id}.result.json"
+    payload = dump_json_bytes(result)
+    with _write_lock:
+        if _write_thread is None:
+            _write_thread = threading.Thread(target=_result_writer, name="result-writer", daemon=True)
+            _write_thread.start()
+    _write_queue.put((result_path, payload))
+    return str(result_path)
+
+
+def wait_for_writes():
+    # Raises the first failed write since the last call, so the caller can mark the job FAILED.
+    if _write_thread is None:
+        return
+    _write_queue.join()
+    if _write_errors:
+        errors = list(_write_errors.items())
+        _write_errors.clear()
+        path, error = errors[0]
+        raise OSError(f"Result write failed for {path}: {error}") from error
 
 
 def configure_logger(log_path):
     logger = logging.getLogger("worker")
     logger.setLevel(logging.INFO)
-    logger.handlers.clear()
-    fmt = logging.Formatter("%(asctime)s | %(levelname)s | %(message)s")
-    fh = logging.FileHandler(log_path, encoding="utf-8")
-    fh.setFormatter(fmt)
+    close_logger(logger)
+    fh = BufferedLogHandler(log_path)
+    fh.setFormatter(LOG_FORMATTER)
     logger.addHandler(fh)
     return logger
 
 
+def close_logger(logger):
+    # Close (not just detach) the previous job's handler so its file descriptor is released.
+    for handler in list(logger.handlers):
+        try:
+            handler.close()
+        except Exception:
+            pass
+    logger.handlers.clear()
+
+
+def flush_logger(logger):
+    for handler in logger.handlers:
+        try:
+            handler.flush()
+        except Exception:
+            pass
+
+
+def marker_paths(job_id, state_dir):
+    # Every state marker a job can end up with, built once at claim time.
+    state_dir = Path(state_dir)
+    markers = {ext[1:]: state_dir / f"{job_id}{ext}" for ext in FINISHED_MARKER_SUFFIXES}
+    markers["processing"] = state_dir / f"{job_id}.processing"
+    return markers
+
+
+def _create_marker(path):
+    with open(path, "x", encoding="utf-8") as f:
+        f.write(datetime.utcnow().isoformat())
+
+
 def claim_job(job_id, state_dir):
-    Path(state_dir).mkdir(parents=True, exist_ok=True)
-    marker = Path(state_dir) / f"{job_id}.processing"
+    markers = marker_paths(job_id, state_dir)
+    # In-process fast path; the marker file below still arbitrates between worker processes.
+    with _claimed_lock:
+        if job_id in _claimed_local:
+            return False, markers
+        _claimed_local.add(job_id)
+
+    _ensure_dir(state_dir)
     try:
-        with open(marker, "x", encoding="utf-8") as f:
-            f.write(datetime.utcnow().isoformat())
-        return True, marker
+        _in_ensured_dir(state_dir, lambda: _create_marker(markers["processing"]))
+        return True, markers
     except FileExistsError:
-        return False, marker
+        with _claimed_lock:
+            _claimed_local.discard(job_id)
+        return False, markers
 
 
-def release_job(marker_path, status):
+def iter_job_files(jobs_dir):
+    # One scandir pass with a plain suffix check; callers get (str path, mtime_ns), no Path per entry.
+    # On Windows the stat comes from the directory listing itself.
     try:
-        done_marker = str(marker_path).replace(".processing", f".{status.lower()}")
-        os.replace(marker_path, done_marker)
+        with os.scandir(jobs_dir) as it:
+            entries = [e for e in it if e.name.lower().endswith(".json") and e.is_file()]
+    except FileNotFoundError:
+        return
+    entries.sort(key=lambda e: e.name.lower())
+    for entry in entries:
+        try:
+            mtime_ns = entry.stat().st_mtime_ns
+        except FileNotFoundError:
+            continue
+        yield entry.path, mtime_ns
+
+
+def finished_job_ids(state_dir):
+    finished = set()
+    try:
+        with os.scandir(state_dir) as it:
+            for entry in it:
+                stem, ext = os.path.splitext(entry.name)
+                if ext in FINISHED_MARKER_SUFFIXES:
+                    finished.add(stem)
+    except FileNotFoundError:
+        pass
+    return finished
+
+
+def release_job(job_id, markers, status):
+    try:
+        key = status.lower()
+        done_marker = markers.get(key) or markers["processing"].with_name(f"{job_id}.{key}")
+        os.replace(markers["processing"], done_marker)
     except Exception:
         pass
+    finally:
+        with _claimed_lock:
+            _claimed_local.discard(job_id)
 
 
 def write_needs_help(path, step, found):
-    Path(path).parent.mkdir(parents=True, exist_ok=True)
-    titles = dump_window_titles()
-    with open(path, "w", encoding="utf-8") as f:
-        f.write("NEEDS_HELP\n")
-        f.write(f"active_window: {get_active_window_title()}\n")
-        f.write(f"step: {step}\n")
-        f.write(f"found: {found}\n")
-        f.write("window_titles:\n")
-        for t in titles:
-            f.write(f"- {t}\n")
-    windows_json_path = str(Path(path).parent / "windows.json")
-    write_json(windows_json_path, {"windows": titles})
+    _ensure_dir(Path(path).parent)
+    active_title, titles = dump_windows()
+    body = "\n".join(
+        [
+            "NEEDS_HELP",
+            f"active_window: {active_title}",
+            f"step: {step}",
+            f"found: {found}",
+            "window_titles:",
+            *[f"- {t}" for t in titles],
+            "",
+        ]
+    )
+    _in_ensured_dir(Path(path).parent, lambda: Path(path).write_text(body, encoding="utf-8"))
+    # Machine-consumed dump: compact separators, no indentation.
+    windows = {"windows": titles}
+    if orjson is not None:
+        payload = orjson.dumps(windows)
+    else:
+        payload = json.dumps(windows, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    (Path(path).parent / "windows.json").write_bytes(payload)
+
+
+def finalize_part_result(part_result, logger):
+    # Runs on the post-processing pool: pure data work only, never touch pywinauto here.
+    for key in ("inputPath", "geoPath"):
+        if part_result.get(key) is not None:
+            part_result[key] = str(part_result[key])
+    logger.info(
+        "Part %s finished: status=%s geo=%s",
+        part_result.get("partId"),
+        part_result.get("status"),
+        part_result.get("geoPath"),
+    )
+    return part_result
 
 
 def format_overlay_text(job_id, done_steps, total_steps, current_action, next_action, hotkey_hint, paused=False):
@@ -259,6 +696,51 @@ def format_overlay_text(job_id, done_steps, total_steps, current_action, next_ac
     return f"{line1}\n{line2}"
 
 
+def acquire_teczone_session(logger, screenshotter, teczone_exe, teczone_title_re, workflow_config_path):
+    # Reuse the previous job's session while its TecZone window is still alive; otherwise start fresh.
+    global _teczone_session
+    tz, _teczone_session = _teczone_session, None
+    same_config = tz is not None and (tz.teczone_exe, tz.teczone_title_re, tz.workflow_config_path) == (
+        teczone_exe,
+        teczone_title_re,
+        workflow_config_path,
+    )
+    if same_config and tz.is_connected():
+        tz.reset_state(logger, screenshotter)
+        logger.info("Reusing TecZone session from the previous job")
+        return tz
+    return TecZoneSession(
+        logger,
+        screenshotter,
+        teczone_exe=teczone_exe,
+        teczone_title_re=teczone_title_re,
+        workflow_config_path=workflow_config_path,
+    )
+
+
+def keep_teczone_session(tz):
+    global _teczone_session
+    _teczone_session = tz
+
+
+def acquire_overlay(text):
+    # One overlay process for the whole run; start() relaunches it if the child died.
+    global _overlay
+    if _overlay is None:
+        _overlay = Overlay(text)
+    else:
+        _overlay.set_text(text)
+    _overlay.start()
+    return _overlay
+
+
+def stop_overlay():
+    global _overlay
+    if _overlay is not None:
+        _overlay.stop()
+        _overlay = None
+
+
 def process_job(
     job_path,
     hotkey_pause="ctrl+alt+p",
@@ -275,17 +757,17 @@ def process_job(
     settings = job.get("settings", {})
 
     log_dir = Path(project_root) / "WORK" / "logs"
-    log_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(log_dir)
     log_path = str(log_dir / f"{job_id}.log")
-    logger = configure_logger(log_path)
+    logger = _in_ensured_dir(log_dir, lambda: configure_logger(log_path))
     init_glitchtip(logger)
     if not disable_sounds and not settings.get("disableSounds", False):
         play_job_start_sound(logger)
 
     screenshots_dir = Path(project_root) / "WORK" / "screenshots" / job_id
-    screenshots_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(screenshots_dir)
     export_dir = settings.get("exportDir") or str(Path(project_root) / "WORK" / "out" / "flat")
-    Path(export_dir).mkdir(parents=True, exist_ok=True)
+    _ensure_dir(export_dir)
 
     xometry_map = {}
     if job.get("xometryJson"):
@@ -298,21 +780,80 @@ def process_job(
 
     input_files = job.get("inputFiles", [])
     total_parts = len(input_files)
-    total_steps = total_parts * len(MAJOR_STEPS)
+    part_names = [p.get("partName") or str(p.get("partId") or "unknown_part") for p in input_files]
+    # "<STEP> <part>" for every step of every part, in run order: index i is the label of step i + 1.
+    step_labels = [f"{step} {name}" for name in part_names for step in MAJOR_STEPS]
+    total_steps = total_parts * MAJOR_STEPS_LEN
     hotkey_enabled = (not disable_hotkeys) and (not settings.get("disableHotkeys", False))
     effective_hotkey = settings.get("hotkeyPause", hotkey_pause)
     hotkey_hint = effective_hotkey if hotkey_enabled else "hotkeys disabled"
 
+    result = {
+        "jobId": job_id,
+        "status": "DONE",
+        "parts": [],
+        "screenshotsDir": str(screenshots_dir),
+        "logPath": log_path,
+    }
+
+    needs_help_path = str(log_dir / f"{job_id}_NEEDS_HELP.txt")
+
+    def finish_job(status, level, message, step, reason, part_id=None, input_path=None, export_path=None):
+        # Shared tail of every exit path: result file, telemetry, end sound, log close.
+        result["status"] = status
+        result_path = write_result(log_dir, job_id, result)
+        capture_glitchtip_event(
+            level,
+            message,
+            job_id=job_id,
+            xometry_ref=xometry_ref,
+            status=status,
+            step=step,
+            part_id=part_id,
+            project_root=project_root,
+            input_path=input_path,
+            export_path=export_path,
+            log_path=log_path,
+            screenshots_dir=str(screenshots_dir),
+            reason=reason,
+        )
+        if not disable_sounds and not settings.get("disableSounds", False):
+            play_job_end_sound(logger, status)
+        close_logger(logger)
+        return result_path, status
+
+    # Reject unusable inputs before paying for the overlay, screenshots and TecZone startup.
+    missing_paths = [part_names[i] for i, p in enumerate(input_files) if not p.get("path")]
+    bad_inputs = [
+        p["path"] for p in input_files if p.get("path") and Path(p["path"]).suffix.lower() not in INPUT_EXTENSIONS
+    ]
+    if (missing_paths or bad_inputs) and not settings.get("dryRun"):
+        problems = []
+        if missing_paths:
+            problems.append(f"Missing input path for parts: {', '.join(missing_paths)}")
+        if bad_inputs:
+            problems.append(f"Unsupported input extension: {', '.join(bad_inputs)}")
+        reason = "; ".join(problems)
+        logger.error(reason)
+        write_needs_help(needs_help_path, "VALIDATE_INPUTS", reason)
+        return finish_job(
+            "NEEDS_HELP",
+            "error",
+            "worker NEEDS_HELP at input validation",
+            "VALIDATE_INPUTS",
+            reason,
+            input_path=bad_inputs[0] if bad_inputs else None,
+        )
+
     overlay = None
     initial_next = "OPEN_FILE" if total_parts > 0 else "WAIT_JOB"
     if not no_overlay:
         try:
-            overlay = Overlay(format_overlay_text(job_id, 0, total_steps, "INIT", initial_next, hotkey_hint))
-            overlay.start()
+            overlay = acquire_overlay(format_overlay_text(job_id, 0, total_steps, "INIT", initial_next, hotkey_hint))
         except Exception as e:
             logger.warning("Overlay disabled due startup error: %s", e)
             overlay = None
-    screenshotter = Screenshotter(str(screenshots_dir))
+    screenshotter = AsyncScreenshotter(str(screenshots_dir))
 
     periodic_seconds = settings.get("screenshotsEverySeconds", 0)
     stop_event = threading.Event()
@@ -322,63 +863,60 @@ def process_job(
 
     if periodic_seconds and periodic_seconds > 0:
         def periodic():
+            # Fixed-rate schedule: snap latency is absorbed instead of added to the period.
+            next_t = time.monotonic() + periodic_seconds
             while not stop_event.is_set():
-                screenshotter.snap("periodic")
-                stop_event.wait(periodic_seconds)
+                # The screen does not change while paused; wait_if_paused already took one "paused" shot.
+                if not pause_controller.is_paused():
+                    screenshotter.snap("periodic")
+                delay = next_t - time.monotonic()
+                if delay < -periodic_seconds:
+                    # Fell more than a period behind; resync instead of firing a burst of catch-up shots.
+                    next_t = time.monotonic() + periodic_seconds
+                    delay = periodic_seconds
+                if delay > 0:
+                    stop_event.wait(delay)
+                next_t += periodic_seconds
         threading.Thread(target=periodic, daemon=True).start()
 
-    result = {
-        "jobId": job_id,
-        "status": "DONE",
-        "parts": [],
-        "screenshotsDir": str(screenshots_dir),
-        "logPath": log_path,
-    }
     overall_status = "DONE"
+    tz = None
+    # Set only where the try body below finishes normally; an escaping exception leaves it False.
+    session_ok = False
+    post_pool = None
+    part_futures = []
     last_step = "INIT"
     last_part_id = None
     last_input_path = None
     last_export_path = None
 
-    def _part_name(i):
-        if i < 1 or i > total_parts:
-            return "-"
-        candidate = input_files[i - 1].get("partName")
-        if candidate:
-            return candidate
-        pid = input_files[i - 1].get("partId")
-        return str(pid or "unknown_part")
-
-    def _step_index(step_name):
-        try:
-            return MAJOR_STEPS.index(step_name) + 1
-        except ValueError:
-            return None
-
     def _overlay_progress(part_index, step_name):
-        idx = _step_index(step_name)
+        idx = STEP_INDEX.get(step_name)
         if idx is None:
             if step_name == "CONNECT_TECZONE":
-                return 0, f"OPEN_FILE {_part_name(1)}" if total_parts else "DRY_RUN"
+                return 0, step_labels[0] if total_parts else "DRY_RUN"
             if step_name == "DRY_RUN":
                 return 0, "FINISH_JOB"
             if step_name == "CLOSE_FILE":
-                done_steps = min(total_steps, part_index * len(MAJOR_STEPS))
-                next_action = f"OPEN_FILE {_part_name(part_index + 1)}" if part_index < total_parts else "FINISH_JOB"
+                done_steps = min(total_steps, part_index * MAJOR_STEPS_LEN)
+                next_action = step_labels[done_steps] if done_steps < total_steps else "FINISH_JOB"
                 return done_steps, next_action
             return 0, "WAIT"
 
-        done_steps = ((part_index - 1) * len(MAJOR_STEPS)) + (idx - 1)
-        if idx < len(MAJOR_STEPS):
-            next_action = f"{MAJOR_STEPS[idx]} {_part_name(part_index)}"
-        elif part_index < total_parts:
-            next_action = f"OPEN_FILE {_part_name(part_index + 1)}"
-        else:
-            next_action = "FINISH_JOB"
+        done_steps = ((part_index - 1) * MAJOR_STEPS_LEN) + (idx - 1)
+        next_action = step_labels[done_steps + 1] if done_steps + 1 < total_steps else "FINISH_JOB"
         return done_steps, next_action
 
+    last_overlay_key = None
+
     def set_overlay(part_index, step, part_name, paused=False):
+        nonlocal last_overlay_key
         if overlay is not None:
+            # Skip the format + pipe write to the overlay process when nothing visible changed.
+            key = (part_index, step, part_name, paused)
+            if key == last_overlay_key:
+                return
+            last_overlay_key = key
             done_steps, next_action = _overlay_progress(part_index, step)
             current_action = f"{step} {part_name}".strip()
             overlay.set_text(
@@ -394,86 +932,44 @@ def process_job(
             )
 
     try:
-        tz = TecZoneSession(
+        tz = acquire_teczone_session(
             logger,
             screenshotter,
-            teczone_exe=teczone_exe,
-            teczone_title_re=teczone_title_re,
-            workflow_config_path=settings.get("teczoneWorkflowConfig"),
+            teczone_exe,
+            teczone_title_re,
+            settings.get("teczoneWorkflowConfig"),
         )
         try:
             set_overlay(0, "CONNECT_TECZONE", "-")
             last_step = "CONNECT_TECZONE"
-            tz.connect()
+            if not tz.is_connected():
+                tz.connect()
         except NeedsHelpError as e:
             overall_status = "NEEDS_HELP"
             screenshotter.snap("needs_help")
-            needs_help_path = str(Path(project_root) / "WORK" / "logs" / f"{job_id}_NEEDS_HELP.txt")
             write_needs_help(needs_help_path, "CONNECT_TECZONE", str(e))
-            capture_glitchtip_event(
-                "error",
-                "worker NEEDS_HELP at connect",
-                job_id=job_id,
-                xometry_ref=xometry_ref,
-                status=overall_status,
-                step="CONNECT_TECZONE",
-                part_id=None,
-                project_root=project_root,
-                input_path=None,
-                export_path=None,
-                log_path=log_path,
-                screenshots_dir=str(screenshots_dir),
-                reason=str(e),
-            )
-            result["status"] = overall_status
-            result_path = str(log_dir / f"{job_id}.result.json")
-            write_json(result_path, result)
-            write_json(str(log_dir / "result.json"), result)
-            if not disable_sounds and not settings.get("disableSounds", False):
-                play_job_end_sound(logger, overall_status)
-            return result_path, overall_status
+            flush_logger(logger)
+            return finish_job(overall_status, "error", "worker NEEDS_HELP at connect", "CONNECT_TECZONE", str(e))
 
         if settings.get("dryRun"):
             set_overlay(0, "DRY_RUN", "-")
             last_step = "DRY_RUN"
             screenshotter.snap("dryrun_connected")
             logger.info("Dry run completed: connected to TecZone and parsed xometry json")
-            result["status"] = "DONE"
-            result_path = str(log_dir / f"{job_id}.result.json")
-            write_json(result_path, result)
-            write_json(str(log_dir / "result.json"), result)
-            capture_glitchtip_event(
-                "info",
-                "worker DONE (dryRun)",
-                job_id=job_id,
-                xometry_ref=xometry_ref,
-                status="DONE",
-                step="DRY_RUN",
-                part_id=None,
-                project_root=project_root,
-                input_path=None,
-                export_path=None,
-                log_path=log_path,
-                screenshots_dir=str(screenshots_dir),
-                reason="dry run completed",
-            )
-            if not disable_sounds and not settings.get("disableSounds", False):
-                play_job_end_sound(logger, "DONE")
-            return result_path, "DONE"
+            outcome = finish_job("DONE", "info", "worker DONE (dryRun)", "DRY_RUN", "dry run completed")
+            session_ok = True
+            return outcome
 
-        pause_shot_taken = False
+        post_pool = ThreadPoolExecutor(max_workers=POST_PROCESS_WORKERS, thread_name_prefix="part-post")
         for index, part in enumerate(input_files):
             part_index = index + 1
             part_id = part.get("partId")
-            part_name = part.get("partName") or str(part_id or "unknown_part")
+            part_name = part_names[index]
             input_path = part.get("path")
             last_part_id = part_id
             last_input_path = input_path
             last_export_path = None
 
-            if input_path and os.path.splitext(input_path)[1].lower() not in [".stp", ".step"]:
-                raise NeedsHelpError(f"Unsupported input extension: {input_path}")
-
             material = xometry_map.get(part_id, {}).get("material")
             part_result = {
                 "partId": part_id,
@@ -490,23 +986,20 @@ def process_job(
             opened_document = False
 
             def wait_if_paused(current_step):
-                nonlocal pause_shot_taken
-                while pause_controller.is_paused():
-                    set_overlay(part_index, current_step, part_name, paused=True)
-                    if not pause_shot_taken:
-                        screenshotter.snap("paused")
-                        pause_shot_taken = True
-                    time.sleep(0.25)
-                if pause_shot_taken:
-                    pause_shot_taken = False
+                if not pause_controller.is_paused():
+                    return
+                set_overlay(part_index, current_step, part_name, paused=True)
+                screenshotter.snap("paused")
+                pause_controller.wait_resume()
 
             try:
                 step = "OPEN_FILE"
                 last_step = step
                 wait_if_paused(step)
                 set_overlay(part_index, step, part_name)
-                screenshotter.snap("open_file_start")
+                screenshotter.snap_deferred("open_file_start")
                 tz.open_file(input_path)
+                screenshotter.commit("open_file_start")
                 screenshotter.snap("open_file_done")
                 opened_document = True
 
@@ -514,8 +1007,9 @@ def process_job(
                 last_step = step
                 wait_if_paused(step)
                 set_overlay(part_index, step, part_name)
-                screenshotter.snap("material_start")
+                screenshotter.snap_deferred("material_start")
                 used_material, note = tz.set_material(material)
+                screenshotter.commit("material_start")
                 part_result["materialUsedInTecZone"] = used_material
                 if note:
                     part_result["notes"] += note
@@ -525,12 +1019,13 @@ def process_job(
                 last_step = step
                 wait_if_paused(step)
                 set_overlay(part_index, step, part_name)
-                screenshotter.snap("export_start")
+                screenshotter.snap_deferred("export_start")
                 export_name_template = settings.get("exportNameTemplate", "<partName>.geo")
                 export_name = export_name_template.replace("<partName>", part_name)
                 export_path = str(Path(export_dir) / export_name)
                 last_export_path = export_path
                 tz.export_geo(export_path)
+                screenshotter.commit("export_start")
                 part_result["geoPath"] = export_path
                 screenshotter.snap("export_done")
                 part_result["thicknessMmDetected"] = tz.get_thickness_mm()
@@ -539,9 +1034,10 @@ def process_job(
                 part_result["status"] = "NEEDS_HELP"
                 part_result["notes"] += str(e)
                 overall_status = "NEEDS_HELP"
+                screenshotter.commit_all()
                 screenshotter.snap("needs_help")
-                needs_help_path = str(Path(project_root) / "WORK" / "logs" / f"{job_id}_NEEDS_HELP.txt")
                 write_needs_help(needs_help_path, f"{step} {part_name}", str(e))
+                flush_logger(logger)
                 capture_glitchtip_event(
                     "error",
                     "worker NEEDS_HELP",
@@ -557,12 +1053,12 @@ def process_job(
                     screenshots_dir=str(screenshots_dir),
                     reason=str(e),
                 )
-                result["parts"].append(part_result)
+                part_futures.append(post_pool.submit(finalize_part_result, part_result, logger))
                 break
             except Exception as e:
                 part_result["status"] = "FAILED"
                 part_result["notes"] += f"Exception: {e}"
-                logger.error("Exception on part %s: %s", part_id, traceback.format_exc())
+                logger.exception("Exception on part %s", part_id)
                 capture_glitchtip_event(
                     "error",
                     "worker FAILED on part",
@@ -579,6 +1075,7 @@ def process_job(
                     reason=str(e),
                     exc=e,
                 )
+                screenshotter.commit_all()
                 screenshotter.snap("failed")
                 if overall_status == "DONE":
                     overall_status = "PARTIAL"
@@ -592,55 +1089,37 @@ def process_job(
                 except Exception as e:
                     logger.warning("Failed to close active file with Ctrl+W: %s", e)
 
-            result["parts"].append(part_result)
+            part_futures.append(post_pool.submit(finalize_part_result, part_result, logger))
+        session_ok = True
     finally:
+        if post_pool is not None:
+            post_pool.shutdown(wait=True)
         stop_event.set()
         pause_controller.stop()
         if overlay is not None:
-            overlay.stop()
+            overlay.set_text(f"WORKER IDLE | last job: {job_id}\nnext: WAIT_JOB")
+        screenshotter.close()
+        # Only a clean job hands its session on; after any failure the next job reconnects from scratch.
+        keep_teczone_session(tz if session_ok and overall_status == "DONE" else None)
+        result["parts"] = [f.result() for f in part_futures]
 
     if overall_status == "DONE" and any(p["status"] == "FAILED" for p in result["parts"]):
         overall_status = "PARTIAL" if any(p["status"] == "DONE" for p in result["parts"]) else "FAILED"
 
-    result["status"] = overall_status
-    result_path = str(log_dir / f"{job_id}.result.json")
-    write_json(result_path, result)
-    write_json(str(log_dir / "result.json"), result)
     if overall_status == "DONE":
-        capture_glitchtip_event(
-            "info",
-            "worker DONE",
-            job_id=job_id,
-            xometry_ref=xometry_ref,
-            status="DONE",
-            step=last_step,
-            part_id=last_part_id,
-            project_root=project_root,
-            input_path=last_input_path,
-            export_path=last_export_path,
-            log_path=log_path,
-            screenshots_dir=str(screenshots_dir),
-            reason="job completed",
-        )
-    elif overall_status in ["NEEDS_HELP", "FAILED", "PARTIAL"]:
-        capture_glitchtip_event(
-            "error",
-            f"worker {overall_status}",
-            job_id=job_id,
-            xometry_ref=xometry_ref,
-            status=overall_status,
-            step=last_step,
-            part_id=last_part_id,
-            project_root=project_root,
-            input_path=last_input_path,
-            export_path=last_export_path,
-            log_path=log_path,
-            screenshots_dir=str(screenshots_dir),
-            reason=f"job ended with status={overall_status}",
-        )
-    if not disable_sounds and not settings.get("disableSounds", False):
-        play_job_end_sound(logger, overall_status)
-    return result_path, overall_status
+        level, message, reason = "info", "worker DONE", "job completed"
+    else:
+        level, message, reason = "error", f"worker {overall_status}", f"job ended with status={overall_status}"
+    return finish_job(
+        overall_status,
+        level,
+        message,
+        last_step,
+        reason,
+        part_id=last_part_id,
+        input_path=last_input_path,
+        export_path=last_export_path,
+    )
 
 
 def run_loop(
@@ -656,58 +1135,99 @@ def run_loop(
     jobs_dir = Path(jobs_dir)
     state_dir = jobs_dir.parent / "state"
     processed_any = False
+    watcher = DirectoryWatcher(jobs_dir, suffix=".json")
+    if not once:
+        watcher.start()
 
-    while True:
-        for job_path in sorted(jobs_dir.glob("*.json")):
-            try:
-                job = read_json(job_path)
-                job_id = job.get("jobId") or job_path.stem
-            except Exception:
-                continue
-
-            ok, marker = claim_job(job_id, state_dir)
-            if not ok:
-                continue
-
-            processed_any = True
-            status = "FAILED"
-            try:
-                _, status = process_job(
-                    job_path,
-                    hotkey_pause=hotkey_pause,
-                    disable_hotkeys=disable_hotkeys,
-                    disable_sounds=disable_sounds,
-                    no_overlay=no_overlay,
-                    teczone_exe=teczone_exe,
-                    teczone_title_re=teczone_title_re,
-                )
-            except Exception as e:
-                capture_glitchtip_event(
-                    "error",
-                    "worker FAILED in run_loop",
-                    job_id=job_id,
-                    xometry_ref=job.get("xometryRef"),
-                    status="FAILED",
-                    step="RUN_LOOP",
-                    part_id=None,
-                    project_root=job.get("projectRoot"),
-                    input_path=None,
-                    export_path=None,
-                    log_path=None,
-                    screenshots_dir=None,
-                    reason=str(e),
-                    exc=e,
-                )
+    try:
+        # path -> (mtime_ns, job_id); job_id is None for files that failed to parse at that mtime.
+        job_ids = {}
+        while True:
+            finished = finished_job_ids(state_dir)
+            seen = set()
+            for job_path, mtime_ns in iter_job_files(jobs_dir):
+                seen.add(job_path)
+                cached = job_ids.get(job_path)
+                if cached is not None and cached[0] == mtime_ns:
+                    if cached[1] is None or cached[1] in finished or cached[1] in _claimed_local:
+                        continue
+                try:
+                    job = read_json(job_path)
+                    job_id = job.get("jobId") or Path(job_path).stem
+                except Exception:
+                    job_ids[job_path] = (mtime_ns, None)
+                    continue
+                job_ids[job_path] = (mtime_ns, job_id)
+                if job_id in finished or job_id in _claimed_local:
+                    continue
+
+                ok, markers = claim_job(job_id, state_dir)
+                if not ok:
+                    continue
+
+                processed_any = True
                 status = "FAILED"
-            finally:
-                release_job(marker, status)
+                try:
+                    _, status = process_job(
+                        job_path,
+                        hotkey_pause=hotkey_pause,
+                        disable_hotkeys=disable_hotkeys,
+                        disable_sounds=disable_sounds,
+                        no_overlay=no_overlay,
+                        teczone_exe=teczone_exe,
+                        teczone_title_re=teczone_title_re,
+                    )
+                except Exception as e:
+                    capture_glitchtip_event(
+                        "error",
+                        "worker FAILED in run_loop",
+                        job_id=job_id,
+                        xometry_ref=job.get("xometryRef"),
+                        status="FAILED",
+                        step="RUN_LOOP",
+                        part_id=None,
+                        project_root=job.get("projectRoot"),
+                        input_path=None,
+                        export_path=None,
+                        log_path=None,
+                        screenshots_dir=None,
+                        reason=str(e),
+                        exc=e,
+                    )
+                    status = "FAILED"
+                finally:
+                    # The marker must not claim DONE before the result files are on disk.
+                    try:
+                        wait_for_writes()
+                    except Exception as e:
+                        capture_glitchtip_event(
+                            "error",
+                            "worker FAILED writing result",
+                            job_id=job_id,
+                            xometry_ref=job.get("xometryRef"),
+                            status="FAILED",
+                            step="WRITE_RESULT",
+                            project_root=job.get("projectRoot"),
+                            reason=str(e),
+                            exc=e,
+                        )
+                        status = "FAILED"
+                    release_job(job_id, markers, status)
+
+                if once:
+                    return processed_any
+
+            for job_path in job_ids.keys() - seen:
+                del job_ids[job_path]
 
             if once:
                 return processed_any
-
-        if once:
-            return processed_any
-        time.sleep(DEFAULT_POLL_SECONDS)
+            # Wakes as soon as a .json lands in jobs_dir; the timeout keeps a fallback rescan
+            # for missed notifications, and falls back to plain polling without a watcher.
+            watcher.wait(WATCHED_RESCAN_SECONDS if watcher.enabled else DEFAULT_POLL_SECONDS)
+    finally:
+        # The overlay outlives single jobs; take it down with the loop.
+        stop_overlay()
 
 
 def main():
@@ -734,6 +1254,7 @@ def main():
             step="GLITCHTIP_TEST",
             reason="manual test event",
         )
+        flush_glitchtip()
         print("GlitchTip test event sent (if DSN configured).")
         return
 
@@ -749,6 +1270,9 @@ def main():
             teczone_exe=args.teczone_exe,
             teczone_title_re=args.teczone_title_re,
         )
+        # Let a queued job-end sound finish before the process exits (--once).
+        wait_for_sounds()
+        wait_for_writes()
     except Exception as e:
         capture_glitchtip_event(
             "error",
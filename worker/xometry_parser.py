@@ -1,39 +1,92 @@
 ﻿import json
+from collections import deque
+
+try:
+    import ijson
+except Exception:
+    ijson = None
 
 
 def extract_parts(obj):
+    # Iterative walk; json.load only yields plain dict/list, so exact type checks are safe.
+    # Children are pushed in reverse so parts come out in the same pre-order as a recursive walk.
     parts = []
-    if isinstance(obj, dict):
-        if "partId" in obj and isinstance(obj.get("partId"), int):
-            parts.append(obj)
-        for v in obj.values():
-            parts.extend(extract_parts(v))
-    elif isinstance(obj, list):
-        for item in obj:
-            parts.extend(extract_parts(item))
+    stack = deque([obj])
+    while stack:
+        cur = stack.pop()
+        kind = type(cur)
+        if kind is dict:
+            if isinstance(cur.get("partId"), int):
+                parts.append(cur)
+            stack.extend(reversed(list(cur.values())))
+        elif kind is list:
+            stack.extend(reversed(cur))
     return parts
 
 
-def load_xometry_map(json_path, logger=None):
-    with open(json_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+def _part_summary(part):
+    return {
+        "material": part.get("material"),
+        "processes": part.get("processes"),
+        "quantityPieces": part.get("quantityPieces"),
+        "fileNameOnPage": part.get("fileNameOnPage"),
+        "tolerance": part.get("tolerance"),
+        "ra": part.get("ra"),
+        "productionRemarks": part.get("productionRemarks"),
+        "thicknessMm": part.get("thicknessMm"),
+    }
+
+
+class _RootIsPart(Exception):
+    pass
+
+
+def _first_token(f):
+    while True:
+        ch = f.read(1)
+        if not ch or not ch.isspace():
+            f.seek(0)
+            return ch
+
 
-    parts = extract_parts(data)
+def _iter_top_level_values(f):
+    # Materializes one top-level subtree at a time instead of the whole document.
+    token = _first_token(f)
+    if token == b"[":
+        yield from ijson.items(f, "item", use_float=True)
+    elif token == b"{":
+        for key, value in ijson.kvitems(f, "", use_float=True):
+            if key == "partId" and isinstance(value, int):
+                # The root object is itself a part; the caller re-reads the full document.
+                raise _RootIsPart()
+            yield value
+    else:
+        yield json.load(f)
+
+
+def _load_parts_streaming(json_path):
     result = {}
-    for part in parts:
-        part_id = part.get("partId")
-        if part_id is None:
-            continue
-        result[part_id] = {
-            "material": part.get("material"),
-            "processes": part.get("processes"),
-            "quantityPieces": part.get("quantityPieces"),
-            "fileNameOnPage": part.get("fileNameOnPage"),
-            "tolerance": part.get("tolerance"),
-            "ra": part.get("ra"),
-            "productionRemarks": part.get("productionRemarks"),
-            "thicknessMm": part.get("thicknessMm"),
-        }
+    with open(json_path, "rb") as f:
+        for value in _iter_top_level_values(f):
+            for part in extract_parts(value):
+                result[part["partId"]] = _part_summary(part)
+    return result
+
+
+def load_xometry_map(json_path, logger=None):
+    result = None
+    if ijson is not None:
+        try:
+            result = _load_parts_streaming(json_path)
+        except _RootIsPart:
+            result = None
+
+    if result is None:
+        with open(json_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        result = {}
+        for part in extract_parts(data):
+            result[part["partId"]] = _part_summary(part)
 
     if logger:
         logger.info("Parsed %d parts from xometry json", len(result))